@@ -1,19 +1,123 @@
 from __future__ import annotations
 
-import json
+import base64
+import binascii
+import gzip
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.adapters.socket_options import TCPKeepAliveAdapter
+from urllib3.util.retry import Retry
 
 from airflow.exceptions import AirflowException
 from airflow.hooks.base import BaseHook
 
+try:
+    import httpx
+
+    _TRANSPORT_ERRORS: tuple[type[Exception], ...] = (
+        requests.exceptions.RequestException,
+        httpx.HTTPError,
+    )
+except ImportError:
+    httpx = None
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+
+
+# Constant headers, frozen at import time; only access_token varies per
+# connection. Hooks are constructed on every operator execute and during DAG
+# parsing, so even this small per-instantiation work is worth hoisting.
+_BASE_HEADERS = MappingProxyType(
+    {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        # base64 payloads compress several-fold; urllib3 decompresses transparently.
+        "Accept-Encoding": "gzip, deflate",
+    }
+)
+
+# Request bodies above this many bytes are gzipped before sending; below it
+# the compression overhead outweighs the wire savings.
+_COMPRESSION_THRESHOLD = 4096
+
+# API endpoint paths, joined with the connection's base URL once per hook.
+_ENDPOINTS = (
+    ("register_file", "/csvpath/register_file"),
+    ("register_file_bulk", "/csvpath/register_file_bulk"),
+    ("register_and_run", "/csvpath/register_and_run"),
+    ("run_status", "/csvpath/run_status"),
+    ("find_files", "/find/find_files"),
+    ("get_file", "/find/get_file"),
+    ("get_file_raw", "/find/get_file_raw"),
+)
+
+# get_file responses keyed by (conn_id, project_name, reference). A reference
+# resolves to the same content until a new version is registered, so repeated
+# pulls of the same reference can be served from process memory. Module scope
+# means the cache outlives any one hook (operators build a fresh hook per
+# execute). Plain OrderedDict rather than functools.lru_cache because
+# registration must be able to evict single entries. All access goes through
+# _cache_lock: one hook (and so one cache) is shared across threads by the
+# fan-out operator, and invalidation can race with lookups.
+#
+# Entries hold full base64 payloads, so the cache is bounded by total payload
+# bytes as well as entry count -- 512 multi-MB files would otherwise pin GBs in
+# a long-lived worker. Values are (payload size, response); responses bigger
+# than the whole byte budget are not cached at all.
+_cache_lock = threading.Lock()
+_GET_FILE_CACHE_MAXSIZE = 512
+_GET_FILE_CACHE_MAX_BYTES = 100_000_000
+_get_file_cache: OrderedDict[tuple[str, str, str], tuple[int, dict]] = OrderedDict()
+_get_file_cache_bytes = 0
+
+# find_files lookups keyed the same way, but with a TTL: new versions can be
+# registered by other processes, so entries only live for a short window.
+# Values are (expiry monotonic timestamp, response).
+_find_files_cache: OrderedDict[tuple[str, str, str], tuple[float, dict]] = OrderedDict()
+
+
+def _reset_response_caches() -> None:
+    """Empties both response caches. Intended for tests."""
+    global _get_file_cache_bytes
+    with _cache_lock:
+        _get_file_cache.clear()
+        _get_file_cache_bytes = 0
+        _find_files_cache.clear()
+
 
 class FlightPathServerHook(BaseHook):
     """
     Hook for FlightPath Server API.
 
     :param flightpath_server_conn_id: The Airflow connection ID for FlightPath Server.
+    :param tcp_keep_alive_idle: Optional. Seconds of idle time before TCP keepalive probes start.
+    :param tcp_keep_alive_count: Optional. Number of keepalive probes before the connection is dropped.
+    :param tcp_keep_alive_interval: Optional. Seconds between keepalive probes.
+    :param adapter: Optional. A custom ``HTTPAdapter`` to mount on the session instead of the
+        default ``TCPKeepAliveAdapter`` (e.g. an adapter with a ``Retry`` policy).
+    :param pool_maxsize: Optional. Maximum number of pooled connections per host. Size this
+        to the number of threads sharing the session to avoid discarded connections.
+    :param retries: Optional. Number of in-process retries (with exponential backoff) for
+        transient errors (429/5xx and connection resets) on idempotent endpoints.
+    :param retry_writes: Optional. If True, also retry register_and_run. Off by default
+        because a retried POST there could run the csvpaths group twice.
+    :param enable_compression: Optional. If True (the default), gzip request bodies larger
+        than 4KB. Requires a server that understands Content-Encoding: gzip.
+    :param use_http2: Optional. If True, send requests over a single HTTP/2 connection via
+        httpx, multiplexing concurrent calls instead of pooling HTTP/1.1 connections.
+        Requires the ``http2`` extra and an HTTP/2-capable server. Defaults to False.
+    :param find_files_ttl: Optional. Seconds a cached find_files response stays valid.
+        Set to 0 to disable caching. Defaults to 60.
+    :param find_files_cache_maxsize: Optional. Maximum number of cached find_files
+        responses. Defaults to 1024.
     """
 
     conn_name_attr = "flightpath_server_conn_id"
@@ -21,48 +125,203 @@ class FlightPathServerHook(BaseHook):
     conn_type = "flightpath_server"
     hook_name = "FlightPath Server"
 
-    def __init__(self, flightpath_server_conn_id: str = default_conn_name) -> None:
+    # Resolved (base_url, api_key) tuples keyed by conn_id, shared across hook
+    # instances so N operators on one worker hit the metadata DB once, not N times.
+    _conn_cache: dict[str, tuple[str, str]] = {}
+
+    def __init__(
+        self,
+        flightpath_server_conn_id: str = default_conn_name,
+        tcp_keep_alive_idle: int = 120,
+        tcp_keep_alive_count: int = 20,
+        tcp_keep_alive_interval: int = 30,
+        adapter: HTTPAdapter | None = None,
+        pool_maxsize: int = 20,
+        retries: int = 5,
+        retry_writes: bool = False,
+        enable_compression: bool = True,
+        use_http2: bool = False,
+        find_files_ttl: float = 60.0,
+        find_files_cache_maxsize: int = 1024,
+    ) -> None:
         super().__init__()
         self.flightpath_server_conn_id = flightpath_server_conn_id
-        self.conn = self.get_connection(flightpath_server_conn_id)
-        self.base_url = self.conn.host
-        self.api_key = self.conn.password  # Assuming API key is stored in password field
-
-        if not self.base_url:
-            raise AirflowException("FlightPath Server base URL not found in connection.")
-        if not self.api_key:
-            raise AirflowException("FlightPath Server API key not found in connection (password field).")
-
-        self.headers = {
-            "access_token": self.api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        self.tcp_keep_alive_idle = tcp_keep_alive_idle
+        self.tcp_keep_alive_count = tcp_keep_alive_count
+        self.tcp_keep_alive_interval = tcp_keep_alive_interval
+        self._adapter = adapter
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.retry_writes = retry_writes
+        self.enable_compression = enable_compression
+        self.use_http2 = use_http2
+        self.find_files_ttl = find_files_ttl
+        self.find_files_cache_maxsize = find_files_cache_maxsize
+        # Session/client construction is guarded explicitly: cached_property
+        # does not lock on newer Pythons, and the fan-out operator's threads
+        # can race on first use, leaking the losers' sessions unclosed.
+        self._transport_lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._httpx_client = None
+
+    @cached_property
+    def _conn_info(self) -> tuple[str, str]:
+        """
+        Resolves and validates (base_url, api_key) from the Airflow connection.
 
-    def _call_api(self, endpoint: str, method: str = "POST", data: dict | None = None) -> dict:
+        Resolution is deferred until the first API call and the result is cached
+        at class level, so hooks are cheap to construct and N operators sharing a
+        conn_id perform one metadata DB lookup instead of N.
         """
-        Makes an API call to the FlightPath Server.
+        cached = self._conn_cache.get(self.flightpath_server_conn_id)
+        if cached is None:
+            conn = self.get_connection(self.flightpath_server_conn_id)
+            base_url = conn.host
+            api_key = conn.password  # Assuming API key is stored in password field
+
+            if not base_url:
+                raise AirflowException("FlightPath Server base URL not found in connection.")
+            if not api_key:
+                raise AirflowException("FlightPath Server API key not found in connection (password field).")
+
+            cached = (base_url, api_key)
+            self._conn_cache[self.flightpath_server_conn_id] = cached
+        return cached
 
-        :param endpoint: The API endpoint to call (e.g., "/csvpath/register_file").
-        :param method: The HTTP method to use (e.g., "POST", "GET").
+    @property
+    def base_url(self) -> str:
+        return self._conn_info[0]
+
+    @property
+    def api_key(self) -> str:
+        return self._conn_info[1]
+
+    @cached_property
+    def headers(self) -> dict:
+        return {**_BASE_HEADERS, "access_token": self.api_key}
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        One session per hook so sequential calls reuse the same pooled
+        TCP/TLS connections instead of paying a handshake per request.
+        """
+        if self._session is None:
+            with self._transport_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        # TCP keepalive probes keep long-idle connections alive across NATs and
+        # firewalls that would otherwise silently drop them between calls.
+        adapter = self._adapter
+        if adapter is None:
+            # Retrying in-process reuses the pooled connection and costs
+            # ms-scale backoff, versus tens of seconds for an Airflow task
+            # re-schedule.
+            retry = Retry(
+                total=self.retries,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["POST"]),
+                respect_retry_after_header=True,
+            )
+            adapter = self._keep_alive_adapter(max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if self._adapter is None and not self.retry_writes:
+            # register_and_run is not idempotent -- a retried POST could run
+            # the csvpaths group twice. Mount a non-retrying adapter on its
+            # URL; requests picks the longest matching prefix.
+            session.mount(self._urls["register_and_run"], self._keep_alive_adapter())
+        return session
+
+    def _keep_alive_adapter(self, **kwargs) -> TCPKeepAliveAdapter:
+        return TCPKeepAliveAdapter(
+            idle=self.tcp_keep_alive_idle,
+            count=self.tcp_keep_alive_count,
+            interval=self.tcp_keep_alive_interval,
+            pool_connections=4,
+            pool_maxsize=self.pool_maxsize,
+            **kwargs,
+        )
+
+    @property
+    def _client(self) -> httpx.Client:
+        """
+        An HTTP/2 client sharing one multiplexed connection across concurrent calls.
+        Only created when ``use_http2`` is enabled.
+        """
+        if httpx is None:
+            raise AirflowException(
+                "use_http2 requires the httpx package. "
+                "Install it with: pip install airflow-provider-flightpath-server[http2]"
+            )
+        if self._httpx_client is None:
+            with self._transport_lock:
+                if self._httpx_client is None:
+                    self._httpx_client = httpx.Client(
+                        http2=True,
+                        headers=self.headers,
+                        timeout=30.0,
+                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                    )
+        return self._httpx_client
+
+    @cached_property
+    def _urls(self) -> dict[str, str]:
+        return {name: f"{self.base_url}{path}" for name, path in _ENDPOINTS}
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Clears the class-level connection cache (e.g. after editing a connection)."""
+        cls._conn_cache.clear()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections."""
+        if self._session is not None:
+            self._session.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+
+    def __enter__(self) -> FlightPathServerHook:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _post(self, url: str, data: dict) -> dict:
+        """
+        POSTs to a FlightPath Server URL and returns the parsed JSON response.
+
+        :param url: The full URL to post to (see ``_urls``).
         :param data: The request body as a dictionary.
         :return: The JSON response from the API.
         :raises AirflowException: If the API call fails or returns an error.
         """
-        url = f"{self.base_url}{endpoint}"
-        self.log.info("Calling FlightPath Server API: %s %s", method, url)
+        self.log.info("Calling FlightPath Server API: POST %s", url)
+
+        body = orjson.dumps(data)
+        headers = None
+        if self.enable_compression and len(body) > _COMPRESSION_THRESHOLD:
+            body = gzip.compress(body)
+            headers = {"Content-Encoding": "gzip"}
 
         try:
-            if method == "POST":
-                response = requests.post(url, headers=self.headers, data=json.dumps(data))
+            if self.use_http2:
+                response = self._client.post(url, content=body, headers=headers)
             else:
-                raise AirflowException(f"Unsupported HTTP method: {method}")
-
+                response = self.session.post(url, data=body, headers=headers)
             response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # orjson decodes response.content directly, skipping the charset
+            # sniff and str round-trip that response.json() performs.
+            return orjson.loads(response.content)
+        except _TRANSPORT_ERRORS as e:
             raise AirflowException(f"FlightPath Server API call failed: {e}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise AirflowException(f"Failed to decode JSON response from FlightPath Server: {e}, Response: {response.text}")
 
     def register_file(
@@ -88,7 +347,24 @@ class FlightPathServerHook(BaseHook):
         }
         if template:
             data["template"] = template
-        return self._call_api("/csvpath/register_file", method="POST", data=data)
+        response = self._post(self._urls["register_file"], data)
+        self.invalidate_reference(project_name, response.get("reference"))
+        return response
+
+    def register_files_bulk(self, items: list[dict]) -> dict:
+        """
+        Registers several named files in a single round-trip using /csvpath/register_file_bulk.
+
+        Each item is a dict with the same keys accepted by :meth:`register_file`
+        (``project_name``, ``name``, ``file_location`` and optionally ``template``).
+
+        :param items: The list of files to register.
+        :return: The JSON response containing one reference per item, in order.
+        """
+        response = self._post(self._urls["register_file_bulk"], {"items": items})
+        for item, reference in zip(items, response.get("references") or []):
+            self.invalidate_reference(item.get("project_name", ""), reference)
+        return response
 
     def register_and_run(
         self,
@@ -124,32 +400,195 @@ class FlightPathServerHook(BaseHook):
             data["file_template"] = file_template
         if run_template:
             data["run_template"] = run_template
-        return self._call_api("/csvpath/register_and_run", method="POST", data=data)
+        response = self._post(self._urls["register_and_run"], data)
+        self.invalidate_reference(project_name, response.get("register_reference"))
+        self.invalidate_reference(project_name, response.get("run_reference"))
+        return response
+
+    def get_run_status(self, project_name: str, reference: str) -> dict:
+        """
+        Returns the status of a run identified by its reference using /csvpath/run_status.
+
+        :param project_name: The name of the project.
+        :param reference: The run reference returned by register_and_run.
+        :return: The JSON response containing the run status.
+        """
+        data = {
+            "project_name": project_name,
+            "reference": reference,
+        }
+        return self._post(self._urls["run_status"], data)
 
     def find_files(self, project_name: str, reference: str) -> dict:
         """
         Finds the paths of registered named-files based on a reference using /find/find_files.
 
+        Responses are cached for ``find_files_ttl`` seconds, so repeated lookups
+        of the same reference within the window are served from process memory.
+
         :param project_name: The name of the project.
         :param reference: The reference to find files.
         :return: The JSON response containing a list of file paths.
         """
+        key = (self.flightpath_server_conn_id, project_name, reference)
+        now = time.monotonic()
+        with _cache_lock:
+            entry = _find_files_cache.get(key)
+            if entry is not None and entry[0] > now:
+                _find_files_cache.move_to_end(key)
+                return entry[1]
         data = {
             "project_name": project_name,
             "reference": reference,
         }
-        return self._call_api("/find/find_files", method="POST", data=data)
+        response = self._post(self._urls["find_files"], data)
+        with _cache_lock:
+            _find_files_cache[key] = (now + self.find_files_ttl, response)
+            _find_files_cache.move_to_end(key)
+            while len(_find_files_cache) > self.find_files_cache_maxsize:
+                _find_files_cache.popitem(last=False)
+        return response
+
+    def bust_cache(self, project_name: str, reference: str | None = None) -> None:
+        """
+        Drops cached find_files lookups for one reference, or a whole project.
+
+        :param project_name: The name of the project.
+        :param reference: Optional. The reference to drop. If None, every cached
+            lookup for the project is dropped.
+        """
+        if reference is not None:
+            with _cache_lock:
+                _find_files_cache.pop((self.flightpath_server_conn_id, project_name, reference), None)
+            return
+        prefix = (self.flightpath_server_conn_id, project_name)
+        with _cache_lock:
+            for key in [k for k in _find_files_cache if k[:2] == prefix]:
+                del _find_files_cache[key]
 
     def get_file(self, project_name: str, reference: str) -> dict:
         """
         Returns the base64 encoded content of a file found by a named-file reference using /find/get_file.
 
+        Responses are memoized in a module-level LRU cache, so repeated pulls of
+        the same reference within a worker process make one network call.
+
         :param project_name: The name of the project.
         :param reference: The reference to the file.
         :return: The JSON response containing the file content.
         """
+        global _get_file_cache_bytes
+        key = (self.flightpath_server_conn_id, project_name, reference)
+        with _cache_lock:
+            entry = _get_file_cache.get(key)
+            if entry is not None:
+                _get_file_cache.move_to_end(key)
+        if entry is not None:
+            return entry[1]
+        data = {
+            "project_name": project_name,
+            "reference": reference,
+        }
+        response = self._post(self._urls["get_file"], data)
+        size = len(response.get("file") or "")
+        if size > _GET_FILE_CACHE_MAX_BYTES:
+            return response
+        with _cache_lock:
+            old = _get_file_cache.pop(key, None)
+            if old is not None:
+                _get_file_cache_bytes -= old[0]
+            _get_file_cache[key] = (size, response)
+            _get_file_cache_bytes += size
+            while (
+                len(_get_file_cache) > _GET_FILE_CACHE_MAXSIZE
+                or _get_file_cache_bytes > _GET_FILE_CACHE_MAX_BYTES
+            ):
+                _, (evicted_size, _) = _get_file_cache.popitem(last=False)
+                _get_file_cache_bytes -= evicted_size
+        return response
+
+    def get_file_stream(self, project_name: str, reference: str, dest_path: str) -> str:
+        """
+        Streams the content of a file found by a named-file reference to a local path
+        using /find/get_file_raw.
+
+        The response body is base64 and is decoded chunk by chunk as it arrives,
+        so memory use stays constant regardless of file size.
+
+        :param project_name: The name of the project.
+        :param reference: The reference to the file.
+        :param dest_path: The local path to write the decoded content to.
+        :return: The destination path.
+        :raises AirflowException: If the API call fails or returns an error.
+        """
+        url = self._urls["get_file_raw"]
         data = {
             "project_name": project_name,
             "reference": reference,
         }
-        return self._call_api("/find/get_file", method="POST", data=data)
+        self.log.info("Calling FlightPath Server API: POST %s", url)
+
+        body = orjson.dumps(data)
+        try:
+            if self.use_http2:
+                with self._client.stream("POST", url, content=body) as response:
+                    response.raise_for_status()
+                    self._decode_base64_to_file(response.iter_bytes(chunk_size=57 * 1024), dest_path)
+            else:
+                with self.session.post(url, data=body, stream=True) as response:
+                    response.raise_for_status()
+                    self._decode_base64_to_file(response.iter_content(chunk_size=57 * 1024), dest_path)
+        except _TRANSPORT_ERRORS as e:
+            self._remove_partial_file(dest_path)
+            raise AirflowException(f"FlightPath Server API call failed: {e}")
+        except binascii.Error as e:
+            # Truncated or malformed base64, e.g. a proxy cutting the stream
+            # or an error page streamed with a 200.
+            self._remove_partial_file(dest_path)
+            raise AirflowException(f"Failed to decode base64 content from FlightPath Server: {e}")
+        return dest_path
+
+    @staticmethod
+    def _remove_partial_file(path: str) -> None:
+        """Removes a partially written download so a failed pull leaves no corrupt file."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _decode_base64_to_file(chunks, dest_path: str) -> None:
+        """
+        Base64-decodes an iterable of byte chunks to a file. Decoding works in
+        4-byte groups, so any remainder (and line wrapping) is carried across
+        chunk boundaries.
+        """
+        pending = bytearray()
+        with open(dest_path, "wb") as f:
+            for chunk in chunks:
+                pending += chunk.replace(b"\r", b"").replace(b"\n", b"")
+                usable = len(pending) - (len(pending) % 4)
+                if usable:
+                    f.write(base64.b64decode(bytes(pending[:usable])))
+                    del pending[:usable]
+            if pending:
+                f.write(base64.b64decode(bytes(pending)))
+
+    def invalidate_reference(self, project_name: str, reference: str | None) -> None:
+        """
+        Drops any cached get_file and find_files responses for a reference.
+
+        Called automatically when a registration returns a reference, so a
+        newly registered version is never shadowed by a stale cache entry.
+
+        :param project_name: The name of the project.
+        :param reference: The reference to invalidate. No-op if None.
+        """
+        if reference is None:
+            return
+        global _get_file_cache_bytes
+        with _cache_lock:
+            entry = _get_file_cache.pop((self.flightpath_server_conn_id, project_name, reference), None)
+            if entry is not None:
+                _get_file_cache_bytes -= entry[0]
+        self.bust_cache(project_name, reference)
@@ -1,5 +1,7 @@
 from airflow.providers.flightpath_server.operators.flightpath_server import (
     FlightPathServerRegisterFileOperator,
+    FlightPathServerBulkRegisterFilesOperator,
     FlightPathServerRegisterAndRunOperator,
+    FlightPathServerRegisterAndRunAsyncOperator,
     FlightPathServerPullDataOperator,
 )
\ No newline at end of file
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import base64
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from airflow.exceptions import AirflowException
 from airflow.models.baseoperator import BaseOperator
 from airflow.providers.flightpath_server.hooks.flightpath_server import FlightPathServerHook
+from airflow.providers.flightpath_server.triggers.flightpath_server import FlightPathRunTrigger
 
 
 class FlightPathServerRegisterFileOperator(BaseOperator):
@@ -61,6 +65,77 @@ class FlightPathServerRegisterFileOperator(BaseOperator):
         return response
 
 
+class FlightPathServerBulkRegisterFilesOperator(BaseOperator):
+    """
+    Registers several named files in FlightPath Server from a single Airflow task.
+
+    Registering N files through N :class:`FlightPathServerRegisterFileOperator`
+    tasks pays one round-trip per file plus Airflow scheduling overhead per task.
+    By default this operator sends them all in one POST to the bulk endpoint; for
+    servers without the bulk endpoint, set ``use_bulk_endpoint=False`` to issue
+    the individual register_file calls concurrently over one pooled session.
+
+    :param task_id: The task ID.
+    :param files: A list of dicts, each with the keys accepted by
+        ``FlightPathServerHook.register_file`` (``project_name``, ``name``,
+        ``file_location`` and optionally ``template``).
+    :param use_bulk_endpoint: Optional. If True (the default), use
+        /csvpath/register_file_bulk. If False, fan out register_file calls over
+        a thread pool and return a per-item result list.
+    :param max_workers: Optional. Number of concurrent calls when
+        ``use_bulk_endpoint`` is False. Defaults to 8.
+    :param flightpath_server_conn_id: The Airflow connection ID for FlightPath Server.
+    """
+
+    template_fields = ("files",)
+
+    def __init__(
+        self,
+        *,
+        files: list[dict],
+        use_bulk_endpoint: bool = True,
+        max_workers: int = 8,
+        flightpath_server_conn_id: str = FlightPathServerHook.default_conn_name,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.files = files
+        self.use_bulk_endpoint = use_bulk_endpoint
+        self.max_workers = max_workers
+        self.flightpath_server_conn_id = flightpath_server_conn_id
+
+    def execute(self, context: Any) -> Any:
+        # Pool size matches worker count so concurrent calls all get a pooled
+        # connection instead of discarding extras.
+        hook = FlightPathServerHook(
+            flightpath_server_conn_id=self.flightpath_server_conn_id,
+            pool_maxsize=max(self.max_workers, 20),
+        )
+        if self.use_bulk_endpoint:
+            self.log.info("Registering %d files in bulk", len(self.files))
+            response = hook.register_files_bulk(items=self.files)
+            self.log.info("Bulk registration complete. References: %s", response.get("references"))
+            return response
+
+        self.log.info(
+            "Registering %d files with %d concurrent workers", len(self.files), self.max_workers
+        )
+
+        def register(item: dict) -> dict:
+            try:
+                return {"ok": True, "result": hook.register_file(**item)}
+            except Exception as e:
+                self.log.error("Failed to register file %s: %s", item.get("name"), e)
+                return {"ok": False, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(register, self.files))
+
+        failures = sum(1 for result in results if not result["ok"])
+        self.log.info("Registered %d files, %d failures", len(results) - failures, failures)
+        return results
+
+
 class FlightPathServerRegisterAndRunOperator(BaseOperator):
     """
     Registers a new version of a named-file and then runs it through a named-paths group.
@@ -134,6 +209,64 @@ class FlightPathServerRegisterAndRunOperator(BaseOperator):
         return response
 
 
+class FlightPathServerRegisterAndRunAsyncOperator(FlightPathServerRegisterAndRunOperator):
+    """
+    Deferrable variant of :class:`FlightPathServerRegisterAndRunOperator`.
+
+    Issues the register_and_run call, then defers to the triggerer, which polls
+    the run status until it is terminal. The worker slot is released for the
+    whole duration of the FlightPath run instead of blocking on the response.
+    Requires a triggerer process and the httpx package (shipped with the
+    ``http2`` extra).
+
+    :param poll_interval: Optional. Seconds between status polls in the triggerer.
+        Defaults to 30.
+    """
+
+    def __init__(self, *, poll_interval: float = 30.0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.poll_interval = poll_interval
+
+    def execute(self, context: Any) -> Any:
+        hook = FlightPathServerHook(flightpath_server_conn_id=self.flightpath_server_conn_id)
+        self.log.info(
+            "Registering and running file '%s' from location '%s' with csvpaths group '%s'",
+            self.file_name,
+            self.file_location,
+            self.csvpaths_group_name,
+        )
+        response = hook.register_and_run(
+            project_name=self.project_name,
+            file_location=self.file_location,
+            file_name=self.file_name,
+            csvpaths_group_name=self.csvpaths_group_name,
+            method=self.method,
+            file_template=self.file_template,
+            run_template=self.run_template,
+        )
+        run_reference = response.get("run_reference")
+        if not run_reference:
+            raise AirflowException("No run_reference received from FlightPath Server.")
+        self.log.info("Run started. Deferring until run '%s' completes", run_reference)
+        self.defer(
+            trigger=FlightPathRunTrigger(
+                project_name=self.project_name,
+                run_reference=run_reference,
+                flightpath_server_conn_id=self.flightpath_server_conn_id,
+                poll_interval=self.poll_interval,
+            ),
+            method_name="execute_complete",
+        )
+
+    def execute_complete(self, context: Any, event: dict) -> Any:
+        if event.get("status") != "complete":
+            raise AirflowException(
+                f"FlightPath run failed: {event.get('message') or event.get('result')}"
+            )
+        self.log.info("Run completed successfully")
+        return event.get("result")
+
+
 class FlightPathServerPullDataOperator(BaseOperator):
     """
     Pulls data from a past run in FlightPath Server and saves it to a file.
@@ -142,6 +275,9 @@ class FlightPathServerPullDataOperator(BaseOperator):
     :param project_name: The name of the project.
     :param reference: The reference to the file to retrieve.
     :param output_path: The local path where the retrieved file content will be saved.
+    :param stream: Optional. If True (the default), stream the content to disk in chunks
+        via /find/get_file_raw so memory use is constant regardless of file size. If False,
+        fetch and decode the whole response in memory via /find/get_file.
     :param flightpath_server_conn_id: The Airflow connection ID for FlightPath Server.
     """
 
@@ -157,6 +293,7 @@ class FlightPathServerPullDataOperator(BaseOperator):
         project_name: str,
         reference: str,
         output_path: str,
+        stream: bool = True,
         flightpath_server_conn_id: str = FlightPathServerHook.default_conn_name,
         **kwargs,
     ) -> None:
@@ -164,6 +301,7 @@ class FlightPathServerPullDataOperator(BaseOperator):
         self.project_name = project_name
         self.reference = reference
         self.output_path = output_path
+        self.stream = stream
         self.flightpath_server_conn_id = flightpath_server_conn_id
 
     def execute(self, context: Any) -> Any:
@@ -173,6 +311,15 @@ class FlightPathServerPullDataOperator(BaseOperator):
             self.reference,
             self.project_name,
         )
+        if self.stream:
+            hook.get_file_stream(
+                project_name=self.project_name,
+                reference=self.reference,
+                dest_path=self.output_path,
+            )
+            self.log.info("File content successfully saved to %s", self.output_path)
+            return self.output_path
+
         response = hook.get_file(
             project_name=self.project_name,
             reference=self.reference,
@@ -181,9 +328,22 @@ class FlightPathServerPullDataOperator(BaseOperator):
         if not file_content_base64:
             raise AirflowException("No file content received from FlightPath Server.")
 
-        file_content = base64.b64decode(file_content_base64)
+        # b64decode accepts bytes-like objects, so decoding through a memoryview
+        # of the ASCII bytes skips the str codec path and one intermediate copy.
+        file_content = base64.b64decode(memoryview(file_content_base64.encode("ascii")))
 
-        with open(self.output_path, "wb") as f:
-            f.write(file_content)
+        fd = os.open(self.output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Hand the decoded buffer to the kernel directly; writev takes the
+            # memoryview without another copy. Short writes are resumed.
+            view = memoryview(file_content)
+            while len(view):
+                if hasattr(os, "writev"):
+                    written = os.writev(fd, [view])
+                else:
+                    written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
         self.log.info("File content successfully saved to %s", self.output_path)
         return self.output_path
@@ -0,0 +1 @@
+from airflow.providers.flightpath_server.triggers.flightpath_server import FlightPathRunTrigger
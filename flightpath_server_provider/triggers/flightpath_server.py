@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+from asgiref.sync import sync_to_async
+
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+from airflow.providers.flightpath_server.hooks.flightpath_server import FlightPathServerHook
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Run statuses after which polling stops.
+_TERMINAL_STATUSES = {"complete", "error", "failed"}
+
+
+class FlightPathRunTrigger(BaseTrigger):
+    """
+    Polls FlightPath Server for the status of a run until it reaches a terminal state.
+
+    Runs in the triggerer, so the Airflow worker slot is released while the
+    FlightPath run is in flight. Requires the httpx package (shipped with the
+    ``http2`` extra) for the async status calls.
+
+    :param project_name: The name of the project.
+    :param run_reference: The run reference returned by register_and_run.
+    :param flightpath_server_conn_id: The Airflow connection ID for FlightPath Server.
+    :param poll_interval: Optional. Seconds between status polls. Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        project_name: str,
+        run_reference: str,
+        flightpath_server_conn_id: str = FlightPathServerHook.default_conn_name,
+        poll_interval: float = 30.0,
+    ) -> None:
+        super().__init__()
+        self.project_name = project_name
+        self.run_reference = run_reference
+        self.flightpath_server_conn_id = flightpath_server_conn_id
+        self.poll_interval = poll_interval
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            "airflow.providers.flightpath_server.triggers.flightpath_server.FlightPathRunTrigger",
+            {
+                "project_name": self.project_name,
+                "run_reference": self.run_reference,
+                "flightpath_server_conn_id": self.flightpath_server_conn_id,
+                "poll_interval": self.poll_interval,
+            },
+        )
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        if httpx is None:
+            yield TriggerEvent(
+                {
+                    "status": "error",
+                    "message": "FlightPathRunTrigger requires the httpx package. "
+                    "Install it with: pip install airflow-provider-flightpath-server[http2]",
+                }
+            )
+            return
+
+        hook = FlightPathServerHook(flightpath_server_conn_id=self.flightpath_server_conn_id)
+        # Connection resolution hits the metadata DB; keep it off the event loop.
+        base_url, headers = await sync_to_async(lambda: (hook.base_url, hook.headers))()
+        url = f"{base_url}/csvpath/run_status"
+        data = {
+            "project_name": self.project_name,
+            "reference": self.run_reference,
+        }
+
+        try:
+            async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
+                while True:
+                    response = await client.post(url, json=data)
+                    response.raise_for_status()
+                    payload = response.json()
+                    status = payload.get("status")
+                    self.log.info("Run %s status: %s", self.run_reference, status)
+                    if status in _TERMINAL_STATUSES:
+                        yield TriggerEvent({"status": status, "result": payload})
+                        return
+                    await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            yield TriggerEvent({"status": "error", "message": str(e)})
@@ -1,146 +1,356 @@
 from __future__ import annotations
 
+import base64
+import gzip
+import json
+import os
 import unittest
 from unittest.mock import patch, MagicMock
 
+import requests
+
 from airflow.exceptions import AirflowException
 from airflow.models import Connection
 from airflow.utils import db
 
+from airflow.providers.flightpath_server.hooks import flightpath_server
 from airflow.providers.flightpath_server.hooks.flightpath_server import FlightPathServerHook
 
+# One Connection shared by every test; the hook never mutates it.
+TEST_CONNECTION = Connection(
+    conn_id="flightpath_server_default",
+    conn_type="flightpath_server",
+    host="http://localhost:8000",
+    password="test_api_key",
+)
+
+# (name, method kwargs, expected URL, expected request body, response body)
+POST_CASES = [
+    (
+        "register_file",
+        {
+            "project_name": "test_project",
+            "name": "test_file.csv",
+            "file_location": "/data/test_file.csv",
+        },
+        "http://localhost:8000/csvpath/register_file",
+        {
+            "project_name": "test_project",
+            "name": "test_file.csv",
+            "file_location": "/data/test_file.csv",
+        },
+        {"reference": "test_ref_123"},
+    ),
+    (
+        "register_files_bulk",
+        {
+            "items": [
+                {"project_name": "test_project", "name": "a.csv", "file_location": "/data/a.csv"},
+                {"project_name": "test_project", "name": "b.csv", "file_location": "/data/b.csv"},
+            ]
+        },
+        "http://localhost:8000/csvpath/register_file_bulk",
+        {
+            "items": [
+                {"project_name": "test_project", "name": "a.csv", "file_location": "/data/a.csv"},
+                {"project_name": "test_project", "name": "b.csv", "file_location": "/data/b.csv"},
+            ]
+        },
+        {"references": ["ref_1", "ref_2"]},
+    ),
+    (
+        "register_and_run",
+        {
+            "project_name": "test_project",
+            "file_location": "/data/new_file.jsonl",
+            "file_name": "new_file.jsonl",
+            "csvpaths_group_name": "my_pipeline",
+        },
+        "http://localhost:8000/csvpath/register_and_run",
+        {
+            "project_name": "test_project",
+            "file_location": "/data/new_file.jsonl",
+            "file_name": "new_file.jsonl",
+            "csvpaths_group_name": "my_pipeline",
+            "method": "collect_paths",
+        },
+        {
+            "message": "success",
+            "run_reference": "run_ref_456",
+            "register_reference": "reg_ref_789",
+        },
+    ),
+    (
+        "get_run_status",
+        {"project_name": "test_project", "reference": "run_ref_456"},
+        "http://localhost:8000/csvpath/run_status",
+        {"project_name": "test_project", "reference": "run_ref_456"},
+        {"status": "running"},
+    ),
+    (
+        "find_files",
+        {"project_name": "test_project", "reference": "file_ref_xyz"},
+        "http://localhost:8000/find/find_files",
+        {"project_name": "test_project", "reference": "file_ref_xyz"},
+        {"files": ["/data/test_file.csv"]},
+    ),
+    (
+        "get_file",
+        {"project_name": "test_project", "reference": "file_ref_xyz"},
+        "http://localhost:8000/find/get_file",
+        {"project_name": "test_project", "reference": "file_ref_xyz"},
+        {"file": "YmFzZTY0IGVuY29kZWQgY29udGVudA=="},
+    ),
+]
+
+
+def _json_response(body: dict) -> MagicMock:
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps(body).encode("utf-8")
+    mock_response.raise_for_status.return_value = None
+    return mock_response
+
 
 class TestFlightPathServerHook(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        db.merge_conn(TEST_CONNECTION)
+
     def setUp(self):
         super().setUp()
-        db.merge_conn(
-            Connection(
-                conn_id="flightpath_server_default",
-                conn_type="flightpath_server",
-                host="http://localhost:8000",
-                password="test_api_key",
-            )
-        )
+        flightpath_server._reset_response_caches()
+        FlightPathServerHook.reset_cache()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("airflow.hooks.base.BaseHook.get_connection")
-    def test_register_file(self, mock_get_connection, mock_requests_post):
-        mock_get_connection.return_value = Connection(
-            conn_id="flightpath_server_default",
-            conn_type="flightpath_server",
-            host="http://localhost:8000",
-            password="test_api_key",
-        )
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"reference": "test_ref_123"}
-        mock_response.raise_for_status.return_value = None
-        mock_requests_post.return_value = mock_response
+    def test_post_endpoints(self, mock_get_connection, mock_requests_post):
+        mock_get_connection.return_value = TEST_CONNECTION
+
+        for name, kwargs, expected_url, expected_body, response_body in POST_CASES:
+            with self.subTest(name):
+                flightpath_server._reset_response_caches()
+                mock_requests_post.reset_mock()
+                mock_requests_post.return_value = _json_response(response_body)
+
+                hook = FlightPathServerHook()
+                response = getattr(hook, name)(**kwargs)
+
+                mock_requests_post.assert_called_once()
+                call_args, call_kwargs = mock_requests_post.call_args
+                self.assertEqual(call_args[0], expected_url)
+                self.assertEqual(json.loads(call_kwargs["data"]), expected_body)
+                self.assertEqual(response, response_body)
+
+    @patch("requests.Session.post")
+    @patch("airflow.hooks.base.BaseHook.get_connection")
+    def test_large_request_bodies_are_gzipped(self, mock_get_connection, mock_requests_post):
+        mock_get_connection.return_value = TEST_CONNECTION
+        mock_requests_post.return_value = _json_response({"reference": "test_ref_123"})
 
         hook = FlightPathServerHook()
-        response = hook.register_file(
+        hook.register_file(
             project_name="test_project",
             name="test_file.csv",
             file_location="/data/test_file.csv",
+            template="x" * 8192,
         )
 
-        mock_requests_post.assert_called_once_with(
-            "http://localhost:8000/csvpath/register_file",
-            headers={
-                "access_token": "test_api_key",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            data='{"project_name": "test_project", "name": "test_file.csv", "file_location": "/data/test_file.csv"}',
+        call_args, call_kwargs = mock_requests_post.call_args
+        self.assertEqual(call_kwargs["headers"], {"Content-Encoding": "gzip"})
+        body = json.loads(gzip.decompress(call_kwargs["data"]))
+        self.assertEqual(body["template"], "x" * 8192)
+
+        # Small bodies are sent uncompressed.
+        mock_requests_post.reset_mock()
+        mock_requests_post.return_value = _json_response({"reference": "test_ref_123"})
+        hook.register_file(
+            project_name="test_project",
+            name="test_file.csv",
+            file_location="/data/test_file.csv",
         )
-        self.assertEqual(response, {"reference": "test_ref_123"})
+        call_args, call_kwargs = mock_requests_post.call_args
+        self.assertIsNone(call_kwargs["headers"])
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("airflow.hooks.base.BaseHook.get_connection")
-    def test_register_and_run(self, mock_get_connection, mock_requests_post):
-        mock_get_connection.return_value = Connection(
-            conn_id="flightpath_server_default",
-            conn_type="flightpath_server",
-            host="http://localhost:8000",
-            password="test_api_key",
-        )
+    def test_get_file_is_cached(self, mock_get_connection, mock_requests_post):
+        mock_get_connection.return_value = TEST_CONNECTION
+        mock_requests_post.return_value = _json_response({"file": "YmFzZTY0IGVuY29kZWQgY29udGVudA=="})
+
+        hook = FlightPathServerHook()
+        first = hook.get_file(project_name="test_project", reference="file_ref_xyz")
+        second = hook.get_file(project_name="test_project", reference="file_ref_xyz")
+
+        # Second call is served from the cache without another POST.
+        self.assertEqual(mock_requests_post.call_count, 1)
+        self.assertEqual(first, second)
+
+        hook.invalidate_reference("test_project", "file_ref_xyz")
+        hook.get_file(project_name="test_project", reference="file_ref_xyz")
+        self.assertEqual(mock_requests_post.call_count, 2)
+
+    @patch.object(flightpath_server, "_GET_FILE_CACHE_MAX_BYTES", 40)
+    @patch("requests.Session.post")
+    @patch("airflow.hooks.base.BaseHook.get_connection")
+    def test_get_file_cache_is_byte_bounded(self, mock_get_connection, mock_requests_post):
+        mock_get_connection.return_value = TEST_CONNECTION
+        hook = FlightPathServerHook()
+
+        # A payload bigger than the whole byte budget is never cached.
+        mock_requests_post.return_value = _json_response({"file": "x" * 50})
+        hook.get_file(project_name="test_project", reference="big_ref")
+        hook.get_file(project_name="test_project", reference="big_ref")
+        self.assertEqual(mock_requests_post.call_count, 2)
+
+        # Inserting past the byte budget evicts the least recently used entry.
+        mock_requests_post.reset_mock()
+        mock_requests_post.return_value = _json_response({"file": "x" * 25})
+        hook.get_file(project_name="test_project", reference="ref_one")
+        hook.get_file(project_name="test_project", reference="ref_two")
+        self.assertEqual(len(flightpath_server._get_file_cache), 1)
+        self.assertEqual(flightpath_server._get_file_cache_bytes, 25)
+
+        hook.get_file(project_name="test_project", reference="ref_one")  # evicted, refetches
+        self.assertEqual(mock_requests_post.call_count, 3)
+
+    @patch("requests.Session.post")
+    @patch("airflow.hooks.base.BaseHook.get_connection")
+    def test_find_files_is_cached_with_ttl(self, mock_get_connection, mock_requests_post):
+        mock_get_connection.return_value = TEST_CONNECTION
+        mock_requests_post.return_value = _json_response({"files": ["/data/test_file.csv"]})
+
+        hook = FlightPathServerHook()
+        first = hook.find_files(project_name="test_project", reference="file_ref_xyz")
+        second = hook.find_files(project_name="test_project", reference="file_ref_xyz")
+
+        # Second lookup within the TTL window is served from the cache.
+        self.assertEqual(mock_requests_post.call_count, 1)
+        self.assertEqual(first, second)
+
+        hook.bust_cache("test_project", "file_ref_xyz")
+        hook.find_files(project_name="test_project", reference="file_ref_xyz")
+        self.assertEqual(mock_requests_post.call_count, 2)
+
+        # A zero TTL disables caching entirely.
+        flightpath_server._reset_response_caches()
+        mock_requests_post.reset_mock()
+        no_ttl_hook = FlightPathServerHook(find_files_ttl=0)
+        no_ttl_hook.find_files(project_name="test_project", reference="file_ref_xyz")
+        no_ttl_hook.find_files(project_name="test_project", reference="file_ref_xyz")
+        self.assertEqual(mock_requests_post.call_count, 2)
+
+    @patch("requests.Session.post")
+    @patch("airflow.hooks.base.BaseHook.get_connection")
+    def test_get_file_stream(self, mock_get_connection, mock_requests_post):
+        mock_get_connection.return_value = TEST_CONNECTION
+        test_content = b"streamed file content, long enough to split across chunks"
+        encoded = base64.b64encode(test_content)
+        # Split mid-group and add line wrapping to exercise the carry-over logic.
+        chunks = [encoded[:10] + b"\r\n", encoded[10:33], b"\n" + encoded[33:]]
+
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "message": "success",
-            "run_reference": "run_ref_456",
-            "register_reference": "reg_ref_789",
-        }
         mock_response.raise_for_status.return_value = None
+        mock_response.iter_content.return_value = iter(chunks)
+        mock_response.__enter__.return_value = mock_response
         mock_requests_post.return_value = mock_response
 
+        output_path = "/tmp/test_hook_stream_output.bin"
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
         hook = FlightPathServerHook()
-        response = hook.register_and_run(
+        returned_path = hook.get_file_stream(
             project_name="test_project",
-            file_location="/data/new_file.jsonl",
-            file_name="new_file.jsonl",
-            csvpaths_group_name="my_pipeline",
+            reference="file_ref_xyz",
+            dest_path=output_path,
         )
 
-        mock_requests_post.assert_called_once_with(
-            "http://localhost:8000/csvpath/register_and_run",
-            headers={
-                "access_token": "test_api_key",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            data='{"project_name": "test_project", "file_location": "/data/new_file.jsonl", "file_name": "new_file.jsonl", "csvpaths_group_name": "my_pipeline", "method": "collect_paths"}',
-        )
+        mock_requests_post.assert_called_once()
+        call_args, call_kwargs = mock_requests_post.call_args
+        self.assertEqual(call_args[0], "http://localhost:8000/find/get_file_raw")
         self.assertEqual(
-            response,
-            {
-                "message": "success",
-                "run_reference": "run_ref_456",
-                "register_reference": "reg_ref_789",
-            },
+            json.loads(call_kwargs["data"]),
+            {"project_name": "test_project", "reference": "file_ref_xyz"},
         )
+        self.assertTrue(call_kwargs["stream"])
+        self.assertEqual(returned_path, output_path)
+        with open(output_path, "rb") as f:
+            self.assertEqual(f.read(), test_content)
+
+        os.remove(output_path)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("airflow.hooks.base.BaseHook.get_connection")
-    def test_get_file(self, mock_get_connection, mock_requests_post):
-        mock_get_connection.return_value = Connection(
-            conn_id="flightpath_server_default",
-            conn_type="flightpath_server",
-            host="http://localhost:8000",
-            password="test_api_key",
-        )
+    def test_get_file_stream_truncated_base64(self, mock_get_connection, mock_requests_post):
+        mock_get_connection.return_value = TEST_CONNECTION
+        encoded = base64.b64encode(b"streamed file content")
+        # Drop the final bytes so the last group is not a multiple of 4.
+        chunks = [encoded[:10], encoded[10:15]]
+
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"file": "YmFzZTY0IGVuY29kZWQgY29udGVudA=="} # base64 encoded "base64 encoded content"
         mock_response.raise_for_status.return_value = None
+        mock_response.iter_content.return_value = iter(chunks)
+        mock_response.__enter__.return_value = mock_response
         mock_requests_post.return_value = mock_response
 
+        output_path = "/tmp/test_hook_stream_truncated.bin"
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
         hook = FlightPathServerHook()
-        response = hook.get_file(
-            project_name="test_project",
-            reference="file_ref_xyz",
-        )
+        with self.assertRaisesRegex(AirflowException, "Failed to decode base64 content"):
+            hook.get_file_stream(
+                project_name="test_project",
+                reference="file_ref_xyz",
+                dest_path=output_path,
+            )
 
-        mock_requests_post.assert_called_once_with(
-            "http://localhost:8000/find/get_file",
-            headers={
-                "access_token": "test_api_key",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            data='{"project_name": "test_project", "reference": "file_ref_xyz"}',
-        )
-        self.assertEqual(response, {"file": "YmFzZTY0IGVuY29kZWQgY29udGVudA=="})
+        # The partial download is removed on failure.
+        self.assertFalse(os.path.exists(output_path))
+
+    @patch("airflow.hooks.base.BaseHook.get_connection")
+    def test_retry_adapters(self, mock_get_connection):
+        mock_get_connection.return_value = TEST_CONNECTION
+        hook = FlightPathServerHook()
+
+        retrying = hook.session.get_adapter("http://localhost:8000/csvpath/register_file")
+        self.assertEqual(retrying.max_retries.total, 5)
+
+        # register_and_run is not idempotent, so it gets a non-retrying adapter.
+        no_retry = hook.session.get_adapter("http://localhost:8000/csvpath/register_and_run")
+        self.assertEqual(no_retry.max_retries.total, 0)
+        hook.close()
 
-    @patch("requests.post")
+    @patch("airflow.hooks.base.BaseHook.get_connection")
+    def test_connection_lookup_is_cached(self, mock_get_connection):
+        mock_get_connection.return_value = TEST_CONNECTION
+        hook_one = FlightPathServerHook()
+        mock_get_connection.assert_not_called()  # resolution is lazy
+
+        self.assertEqual(hook_one.base_url, "http://localhost:8000")
+        hook_two = FlightPathServerHook()
+        self.assertEqual(hook_two.base_url, "http://localhost:8000")
+
+        # Both hooks share one metadata DB lookup.
+        mock_get_connection.assert_called_once()
+
+    @patch("airflow.hooks.base.BaseHook.get_connection")
+    def test_session_headers(self, mock_get_connection):
+        mock_get_connection.return_value = TEST_CONNECTION
+        hook = FlightPathServerHook()
+        self.assertEqual(hook.session.headers["access_token"], "test_api_key")
+        self.assertEqual(hook.session.headers["Content-Type"], "application/json")
+        self.assertEqual(hook.session.headers["Accept"], "application/json")
+        hook.close()
+
+    @patch("requests.Session.post")
     @patch("airflow.hooks.base.BaseHook.get_connection")
     def test_api_call_failure(self, mock_get_connection, mock_requests_post):
-        mock_get_connection.return_value = Connection(
-            conn_id="flightpath_server_default",
-            conn_type="flightpath_server",
-            host="http://localhost:8000",
-            password="test_api_key",
-        )
+        mock_get_connection.return_value = TEST_CONNECTION
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Bad Request")
@@ -154,18 +364,13 @@ class TestFlightPathServerHook(unittest.TestCase):
                 file_location="/data/test_file.csv",
             )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("airflow.hooks.base.BaseHook.get_connection")
     def test_api_call_json_decode_error(self, mock_get_connection, mock_requests_post):
-        mock_get_connection.return_value = Connection(
-            conn_id="flightpath_server_default",
-            conn_type="flightpath_server",
-            host="http://localhost:8000",
-            password="test_api_key",
-        )
+        mock_get_connection.return_value = TEST_CONNECTION
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"Invalid JSON response"
         mock_response.text = "Invalid JSON response"
         mock_response.raise_for_status.return_value = None
         mock_requests_post.return_value = mock_response
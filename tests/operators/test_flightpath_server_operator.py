@@ -5,11 +5,16 @@ from unittest.mock import patch, MagicMock
 import base64
 import os
 
+from airflow.exceptions import AirflowException, TaskDeferred
+
 from airflow.providers.flightpath_server.operators.flightpath_server import (
     FlightPathServerRegisterFileOperator,
+    FlightPathServerBulkRegisterFilesOperator,
     FlightPathServerRegisterAndRunOperator,
+    FlightPathServerRegisterAndRunAsyncOperator,
     FlightPathServerPullDataOperator,
 )
+from airflow.providers.flightpath_server.triggers.flightpath_server import FlightPathRunTrigger
 
 
 class TestFlightPathServerRegisterFileOperator(unittest.TestCase):
@@ -34,6 +39,50 @@ class TestFlightPathServerRegisterFileOperator(unittest.TestCase):
         self.assertEqual(response, {"reference": "test_ref_123"})
 
 
+class TestFlightPathServerBulkRegisterFilesOperator(unittest.TestCase):
+    @patch("airflow.providers.flightpath_server.hooks.flightpath_server.FlightPathServerHook.register_files_bulk")
+    def test_execute(self, mock_register_files_bulk):
+        mock_register_files_bulk.return_value = {"references": ["ref_1", "ref_2"]}
+
+        files = [
+            {"project_name": "test_project", "name": "a.csv", "file_location": "/data/a.csv"},
+            {"project_name": "test_project", "name": "b.csv", "file_location": "/data/b.csv"},
+        ]
+        operator = FlightPathServerBulkRegisterFilesOperator(
+            task_id="test_bulk_register_files",
+            files=files,
+        )
+        response = operator.execute(context={})
+
+        mock_register_files_bulk.assert_called_once_with(items=files)
+        self.assertEqual(response, {"references": ["ref_1", "ref_2"]})
+
+    @patch("airflow.providers.flightpath_server.hooks.flightpath_server.FlightPathServerHook.register_file")
+    def test_execute_threaded(self, mock_register_file):
+        def register(project_name, name, file_location, template=None):
+            if name == "bad.csv":
+                raise RuntimeError("boom")
+            return {"reference": f"ref_{name}"}
+
+        mock_register_file.side_effect = register
+
+        operator = FlightPathServerBulkRegisterFilesOperator(
+            task_id="test_threaded_register_files",
+            files=[
+                {"project_name": "test_project", "name": "a.csv", "file_location": "/data/a.csv"},
+                {"project_name": "test_project", "name": "bad.csv", "file_location": "/data/bad.csv"},
+            ],
+            use_bulk_endpoint=False,
+            max_workers=2,
+        )
+        results = operator.execute(context={})
+
+        self.assertEqual(mock_register_file.call_count, 2)
+        self.assertEqual(results[0], {"ok": True, "result": {"reference": "ref_a.csv"}})
+        self.assertFalse(results[1]["ok"])
+        self.assertIn("boom", results[1]["error"])
+
+
 class TestFlightPathServerRegisterAndRunOperator(unittest.TestCase):
     @patch("airflow.providers.flightpath_server.hooks.flightpath_server.FlightPathServerHook.register_and_run")
     def test_execute(self, mock_register_and_run):
@@ -71,7 +120,86 @@ class TestFlightPathServerRegisterAndRunOperator(unittest.TestCase):
         )
 
 
+class TestFlightPathServerRegisterAndRunAsyncOperator(unittest.TestCase):
+    @patch("airflow.providers.flightpath_server.hooks.flightpath_server.FlightPathServerHook.register_and_run")
+    def test_execute_defers(self, mock_register_and_run):
+        mock_register_and_run.return_value = {
+            "message": "success",
+            "run_reference": "run_ref_456",
+            "register_reference": "reg_ref_789",
+        }
+
+        operator = FlightPathServerRegisterAndRunAsyncOperator(
+            task_id="test_register_and_run_async",
+            project_name="test_project",
+            file_location="/data/new_file.jsonl",
+            file_name="new_file.jsonl",
+            csvpaths_group_name="my_pipeline",
+            poll_interval=10.0,
+        )
+        with self.assertRaises(TaskDeferred) as deferred:
+            operator.execute(context={})
+
+        trigger = deferred.exception.trigger
+        self.assertIsInstance(trigger, FlightPathRunTrigger)
+        self.assertEqual(trigger.run_reference, "run_ref_456")
+        self.assertEqual(trigger.poll_interval, 10.0)
+        self.assertEqual(deferred.exception.method_name, "execute_complete")
+
+    def test_execute_complete(self):
+        operator = FlightPathServerRegisterAndRunAsyncOperator(
+            task_id="test_register_and_run_async",
+            project_name="test_project",
+            file_location="/data/new_file.jsonl",
+            file_name="new_file.jsonl",
+            csvpaths_group_name="my_pipeline",
+        )
+        result = operator.execute_complete(
+            context={},
+            event={"status": "complete", "result": {"status": "complete"}},
+        )
+        self.assertEqual(result, {"status": "complete"})
+
+        with self.assertRaisesRegex(AirflowException, "FlightPath run failed"):
+            operator.execute_complete(context={}, event={"status": "failed", "message": "boom"})
+
+
 class TestFlightPathServerPullDataOperator(unittest.TestCase):
+    @patch("airflow.providers.flightpath_server.hooks.flightpath_server.FlightPathServerHook.get_file_stream")
+    def test_execute_stream(self, mock_get_file_stream):
+        test_content = "This is some test content."
+        output_path = "/tmp/test_stream_output.txt"
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+        def write_file(project_name, reference, dest_path):
+            with open(dest_path, "w") as f:
+                f.write(test_content)
+            return dest_path
+
+        mock_get_file_stream.side_effect = write_file
+
+        operator = FlightPathServerPullDataOperator(
+            task_id="test_pull_data_stream",
+            project_name="test_project",
+            reference="file_ref_xyz",
+            output_path=output_path,
+        )
+        returned_path = operator.execute(context={})
+
+        mock_get_file_stream.assert_called_once_with(
+            project_name="test_project",
+            reference="file_ref_xyz",
+            dest_path=output_path,
+        )
+        self.assertEqual(returned_path, output_path)
+
+        with open(output_path, "r") as f:
+            read_content = f.read()
+        self.assertEqual(read_content, test_content)
+
+        os.remove(output_path)
+
     @patch("airflow.providers.flightpath_server.hooks.flightpath_server.FlightPathServerHook.get_file")
     def test_execute(self, mock_get_file):
         test_content = "This is some test content."
@@ -87,6 +215,7 @@ class TestFlightPathServerPullDataOperator(unittest.TestCase):
             project_name="test_project",
             reference="file_ref_xyz",
             output_path=output_path,
+            stream=False,
         )
         returned_path = operator.execute(context={})
 
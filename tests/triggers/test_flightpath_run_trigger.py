@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import unittest
+
+from airflow.providers.flightpath_server.triggers.flightpath_server import FlightPathRunTrigger
+
+
+class TestFlightPathRunTrigger(unittest.TestCase):
+    def test_serialize(self):
+        trigger = FlightPathRunTrigger(
+            project_name="test_project",
+            run_reference="run_ref_456",
+            flightpath_server_conn_id="flightpath_server_default",
+            poll_interval=10.0,
+        )
+        classpath, kwargs = trigger.serialize()
+
+        self.assertEqual(
+            classpath,
+            "airflow.providers.flightpath_server.triggers.flightpath_server.FlightPathRunTrigger",
+        )
+        self.assertEqual(
+            kwargs,
+            {
+                "project_name": "test_project",
+                "run_reference": "run_ref_456",
+                "flightpath_server_conn_id": "flightpath_server_default",
+                "poll_interval": 10.0,
+            },
+        )